@@ -18,6 +18,8 @@ TELEGRAM_BOT_TOKEN=your_telegram_bot_token_here
 COINGECKO_API_KEY=your_coingecko_pro_api_key_here
 TELEGRAM_CHAT_ID=your_telegram_chat_id_here
 PORT=3000
+LAST_CHECKED_FILE=last_checked.json
+COINGECKO_CALLS_PER_MINUTE=50
 
 // package.json
 {
@@ -30,10 +32,8 @@ PORT=3000
     "dev": "nodemon index.js"
   },
   "dependencies": {
-    "node-telegram-bot-api": "^0.66.0",
     "axios": "^1.6.0",
     "node-cron": "^3.0.3",
-    "moment-timezone": "^0.5.43",
     "express": "^4.18.2"
   },
   "devDependencies": {
@@ -42,111 +42,395 @@ PORT=3000
 }
 
 // index.js
-const TelegramBot = require('node-telegram-bot-api');
 const axios = require('axios');
 const cron = require('node-cron');
-const moment = require('moment-timezone');
+const fs = require('fs');
+const https = require('https');
 
 // Environment variables
 const TELEGRAM_BOT_TOKEN = process.env.TELEGRAM_BOT_TOKEN;
 const COINGECKO_API_KEY = process.env.COINGECKO_API_KEY;
 const TELEGRAM_CHAT_ID = process.env.TELEGRAM_CHAT_ID;
+const LAST_CHECKED_FILE = process.env.LAST_CHECKED_FILE || 'last_checked.json';
+const COINGECKO_CALLS_PER_MINUTE = Number(process.env.COINGECKO_CALLS_PER_MINUTE) || 50;
+
+// Market pages fetched in parallel per scan
+const PAGE_CONCURRENCY = 4;
+
+// Keep-alive agent shared by every API call (CoinGecko and Telegram), so
+// requests reuse pooled TCP/TLS connections instead of handshaking each time.
+// maxSockets is per host, so the pool matches the page concurrency; idle
+// sockets close after a minute rather than going stale between daily checks.
+const httpsAgent = new https.Agent({
+  keepAlive: true,
+  maxSockets: PAGE_CONCURRENCY,
+  maxFreeSockets: PAGE_CONCURRENCY,
+  timeout: 60 * 1000
+});
 
-// Initialize bot
-const bot = new TelegramBot(TELEGRAM_BOT_TOKEN, { polling: false });
-
-// In-memory storage for last check times (use Redis in production)
+// Last alert time per token, mirrored to LAST_CHECKED_FILE so a restart
+// doesn't re-alert tokens that were already reported. Kept in alert-time
+// order (oldest first) so expired entries can be pruned from the front.
 const lastCheckedTokens = new Map();
 
+// Tokens aren't re-alerted until this long after their last alert
+const ALERT_COOLDOWN_MS = 24 * 60 * 60 * 1000;
+
+function loadLastCheckedTokens() {
+  try {
+    const saved = JSON.parse(fs.readFileSync(LAST_CHECKED_FILE, 'utf8'));
+    const now = Date.now();
+    // JSON key order isn't guaranteed to be alert order (integer-like ids sort first)
+    const entries = Object.entries(saved).sort((a, b) => a[1] - b[1]);
+    for (const [tokenId, checkedAt] of entries) {
+      if (now - checkedAt < ALERT_COOLDOWN_MS) {
+        lastCheckedTokens.set(tokenId, checkedAt);
+      }
+    }
+    console.log(`Loaded ${lastCheckedTokens.size} previously alerted tokens`);
+  } catch (error) {
+    if (error.code !== 'ENOENT') {
+      console.error('Error loading last checked tokens:', error.message);
+    }
+  }
+}
+
+// Re-inserting moves the token to the back, keeping the map in alert-time order
+function markTokenAlerted(tokenId, now) {
+  lastCheckedTokens.delete(tokenId);
+  lastCheckedTokens.set(tokenId, now);
+}
+
+// Drop entries whose cooldown has passed, so the map and file don't grow forever.
+// The map is oldest-first, so this stops at the first entry still cooling down.
+// Returns the number of entries removed.
+function pruneLastCheckedTokens(now = Date.now()) {
+  let removed = 0;
+  for (const [tokenId, checkedAt] of lastCheckedTokens) {
+    if (now - checkedAt < ALERT_COOLDOWN_MS) {
+      break;
+    }
+    lastCheckedTokens.delete(tokenId);
+    removed++;
+  }
+  return removed;
+}
+
+// Written to a temp file and renamed into place, so a crash mid-write never
+// leaves a truncated file behind; async so the event loop isn't blocked
+async function saveLastCheckedTokens() {
+  const tmpFile = `${LAST_CHECKED_FILE}.tmp`;
+  try {
+    await fs.promises.writeFile(tmpFile, JSON.stringify(Object.fromEntries(lastCheckedTokens)));
+    await fs.promises.rename(tmpFile, LAST_CHECKED_FILE);
+  } catch (error) {
+    console.error('Error saving last checked tokens:', error.message);
+  }
+}
+
+// Escape the characters Telegram's HTML parse mode treats as markup, so token
+// names like "<Meme> & Co" don't break (or get rejected by) the message
+const HTML_ESCAPES = { '&': '&amp;', '<': '&lt;', '>': '&gt;' };
+
+function escapeHtml(text) {
+  return String(text).replace(/[&<>]/g, (char) => HTML_ESCAPES[char]);
+}
+
+const TIMEZONE = 'Asia/Singapore'; // GMT+8
+
+// Built once and reused; Intl ships with Node, so no timezone library is needed
+const gmt8Formatter = new Intl.DateTimeFormat('en-US', {
+  timeZone: TIMEZONE,
+  year: 'numeric',
+  month: '2-digit',
+  day: '2-digit',
+  hour: '2-digit',
+  minute: '2-digit',
+  second: '2-digit',
+  hourCycle: 'h23'
+});
+
+// Formats as YYYY-MM-DD HH:mm:ss in GMT+8
+function formatGMT8(time) {
+  const parts = {};
+  for (const { type, value } of gmt8Formatter.formatToParts(time)) {
+    parts[type] = value;
+  }
+  return `${parts.year}-${parts.month}-${parts.day} ${parts.hour}:${parts.minute}:${parts.second}`;
+}
+
+// Shared number formatters - toLocaleString() builds a new Intl formatter on every call
+const priceFormatter = new Intl.NumberFormat('en-US', { maximumFractionDigits: 3 });
+// Sub-cent prices would round to "0" with fixed fraction digits, so keep significant digits instead
+const smallPriceFormatter = new Intl.NumberFormat('en-US', { maximumSignificantDigits: 4 });
+
+function formatPrice(price) {
+  return price < 0.01 ? smallPriceFormatter.format(price) : priceFormatter.format(price);
+}
+
+const sleep = (ms) => new Promise(resolve => setTimeout(resolve, ms));
+
+// Paces API calls at an adaptive rate: halves on every 429 and creeps back
+// towards the configured rate after a run of successful calls. Up to `burst`
+// calls may go out back to back after an idle period.
+class TokenBucket {
+  constructor(ratePerSecond, burst = 1) {
+    this.maxRate = ratePerSecond;
+    this.rate = ratePerSecond;
+    this.burst = burst;
+    this.nextSlot = 0;
+    this.successStreak = 0;
+  }
+
+  async acquire() {
+    const now = Date.now();
+    const interval = 1000 / this.rate;
+    // Slots may lag behind now by up to burst - 1 intervals, which is the saved-up burst
+    const slot = Math.max(now - (this.burst - 1) * interval, this.nextSlot);
+    this.nextSlot = slot + interval;
+    if (slot > now) {
+      await sleep(slot - now);
+    }
+  }
+
+  onSuccess() {
+    if (this.rate < this.maxRate && ++this.successStreak >= 10) {
+      this.rate = Math.min(this.maxRate, this.rate * 1.2);
+      this.successStreak = 0;
+    }
+  }
+
+  onRateLimited(retryAfterMs = 0) {
+    this.rate = Math.max(this.maxRate / 32, this.rate / 2);
+    this.successStreak = 0;
+    // Hold every caller, not just the one that got throttled, until the server allows more
+    this.nextSlot = Math.max(this.nextSlot, Date.now() + retryAfterMs);
+  }
+}
+
+// Retry-After is either a number of seconds or an HTTP date
+function parseRetryAfter(value) {
+  if (!value) {
+    return 0;
+  }
+  const seconds = Number(value);
+  if (!Number.isNaN(seconds)) {
+    return Math.max(0, seconds * 1000);
+  }
+  const date = Date.parse(value);
+  return Number.isNaN(date) ? 0 : Math.max(0, date - Date.now());
+}
+
+const COINGECKO_BURST = 5;
+const MAX_REQUEST_ATTEMPTS = 6;
+const BACKOFF_BASE_MS = 1000;
+const BACKOFF_CAP_MS = 60000;
+const BACKOFF_JITTER_MS = 1000;
+
+// Exponential backoff with jitter, so retries from concurrent requests don't line up
+function backoffDelay(attempt) {
+  return Math.min(BACKOFF_CAP_MS, BACKOFF_BASE_MS * 2 ** (attempt - 1)) + Math.random() * BACKOFF_JITTER_MS;
+}
+
+// Runs worker over items with at most `limit` calls in flight, keeping result order.
+// Stops handing out new items once any call fails.
+async function mapWithConcurrency(items, limit, worker) {
+  const results = new Array(items.length);
+  let next = 0;
+  const runners = Array.from({ length: Math.min(limit, items.length) }, async () => {
+    while (next < items.length) {
+      const index = next++;
+      try {
+        results[index] = await worker(items[index], index);
+      } catch (error) {
+        next = items.length;
+        throw error;
+      }
+    }
+  });
+  await Promise.all(runners);
+  return results;
+}
+
+// Minimal in-process cache whose entries expire after ttlMs
+class TTLCache {
+  constructor(ttlMs) {
+    this.ttlMs = ttlMs;
+    this.store = new Map();
+  }
+
+  get(key) {
+    const entry = this.store.get(key);
+    if (!entry) {
+      return undefined;
+    }
+    if (Date.now() - entry.storedAt > this.ttlMs) {
+      this.store.delete(key);
+      return undefined;
+    }
+    return entry.value;
+  }
+
+  set(key, value) {
+    this.store.set(key, { value, storedAt: Date.now() });
+  }
+}
+
+const MARKETS_CACHE_TTL_MS = 5 * 60 * 1000;
+const MAX_TOKENS = 3000;
+
+// Static query params, built once instead of on every request (axios doesn't mutate them)
+const MARKETS_PARAMS = {
+  vs_currency: 'usd',
+  order: 'market_cap_desc',
+  per_page: 250, // CoinGecko max per page
+  sparkline: false,
+  price_change_percentage: '1h,24h'
+};
+
 class CoinGeckoATHMonitor {
   constructor() {
     this.apiBaseUrl = 'https://pro-api.coingecko.com/api/v3';
-    this.timezone = 'Asia/Singapore'; // GMT+8
+    this.client = axios.create({
+      baseURL: this.apiBaseUrl,
+      headers: { 'X-Cg-Pro-Api-Key': COINGECKO_API_KEY },
+      httpsAgent
+    });
+    // Telegram Bot API called directly over the same pooled agent
+    this.telegramClient = axios.create({
+      baseURL: `https://api.telegram.org/bot${TELEGRAM_BOT_TOKEN}`,
+      httpsAgent
+    });
+    this.rateLimiter = new TokenBucket(COINGECKO_CALLS_PER_MINUTE / 60, COINGECKO_BURST);
+    this.marketsCache = new TTLCache(MARKETS_CACHE_TTL_MS);
   }
 
   async makeApiRequest(endpoint, params = {}) {
-    try {
-      const response = await axios.get(`${this.apiBaseUrl}${endpoint}`, {
-        headers: {
-          'X-Cg-Pro-Api-Key': COINGECKO_API_KEY
-        },
-        params
-      });
-      return response.data;
-    } catch (error) {
-      console.error(`API request failed: ${error.message}`);
-      throw error;
+    for (let attempt = 1; ; attempt++) {
+      await this.rateLimiter.acquire();
+      try {
+        const response = await this.client.get(endpoint, { params });
+        this.rateLimiter.onSuccess();
+        return response.data;
+      } catch (error) {
+        const status = error.response && error.response.status;
+        if (status === 429 && attempt < MAX_REQUEST_ATTEMPTS) {
+          const retryAfter = parseRetryAfter(error.response.headers['retry-after']);
+          this.rateLimiter.onRateLimited(retryAfter || backoffDelay(attempt));
+          console.log(`Rate limited on ${endpoint}, slowing to ${(this.rateLimiter.rate * 60).toFixed(1)} calls/min`);
+          continue;
+        }
+        if (status >= 500 && attempt < MAX_REQUEST_ATTEMPTS) {
+          const delay = backoffDelay(attempt);
+          console.log(`Server error ${status} on ${endpoint}, retrying in ${(delay / 1000).toFixed(1)}s`);
+          await sleep(delay);
+          continue;
+        }
+        console.error(`API request failed: ${error.message}`);
+        throw error;
+      }
     }
   }
 
   async getTop3000Tokens() {
+    // Back-to-back checks (e.g. startup right before the daily run) reuse the last fetch
+    const cached = this.marketsCache.get('top3000');
+    if (cached) {
+      console.log('Using cached market data');
+      return cached;
+    }
+
     try {
       const allTokens = [];
-      const perPage = 250; // CoinGecko max per page
-      const totalPages = Math.ceil(3000 / perPage);
-
-      for (let page = 1; page <= totalPages; page++) {
-        console.log(`Fetching page ${page}/${totalPages}...`);
-        
-        const tokens = await this.makeApiRequest('/coins/markets', {
-          vs_currency: 'usd',
-          order: 'market_cap_desc',
-          per_page: perPage,
-          page: page,
-          sparkline: false,
-          price_change_percentage: '1h,24h'
-        });
-
-        allTokens.push(...tokens);
-        
-        // Rate limiting - wait 1 second between requests
-        await new Promise(resolve => setTimeout(resolve, 1000));
+      const perPage = MARKETS_PARAMS.per_page;
+      const totalPages = Math.ceil(MAX_TOKENS / perPage);
+
+      // Pages are fetched concurrently; the rate limiter still paces request starts
+      const pages = Array.from({ length: totalPages }, (_, i) => i + 1);
+      console.log(`Fetching ${totalPages} market pages...`);
+      const pageResults = await mapWithConcurrency(pages, PAGE_CONCURRENCY, (page) =>
+        this.makeApiRequest('/coins/markets', { ...MARKETS_PARAMS, page })
+      );
+
+      // Ranks can shift between concurrent page requests, so the same coin may show
+      // up on two pages; index by id in the same pass that flattens the pages
+      const seenIds = new Set();
+      for (const tokens of pageResults) {
+        // Keep only the fields the scan reads; full rows carry ~30 fields each
+        for (const token of tokens) {
+          if (allTokens.length === MAX_TOKENS) {
+            break;
+          }
+          if (seenIds.has(token.id)) {
+            continue;
+          }
+          seenIds.add(token.id);
+          allTokens.push({
+            id: token.id,
+            name: token.name,
+            symbol: token.symbol,
+            current_price: token.current_price,
+            ath: token.ath,
+            ath_date: token.ath_date,
+            price_change_percentage_1h_in_currency: token.price_change_percentage_1h_in_currency,
+            price_change_percentage_24h: token.price_change_percentage_24h
+          });
+        }
       }
 
-      return allTokens.slice(0, 3000); // Ensure we only get top 3000
+      this.marketsCache.set('top3000', allTokens);
+      return allTokens;
     } catch (error) {
       console.error('Error fetching top 3000 tokens:', error.message);
       throw error;
     }
   }
 
-  async checkTokenATH(tokenId) {
-    try {
-      const tokenData = await this.makeApiRequest(`/coins/${tokenId}`, {
-        localization: false,
-        tickers: false,
-        market_data: true,
-        community_data: false,
-        developer_data: false
-      });
-
-      const currentPrice = tokenData.market_data.current_price.usd;
-      const ath = tokenData.market_data.ath.usd;
-      const athDate = new Date(tokenData.market_data.ath_date.usd);
-      
-      // Check if current price is at or very close to ATH (within 0.1%)
-      const isAtATH = currentPrice >= (ath * 0.999);
-      
-      // Check if ATH was achieved in the last hour
-      const oneHourAgo = new Date(Date.now() - 60 * 60 * 1000);
-      const isRecentATH = athDate > oneHourAgo;
-
-      return {
-        id: tokenId,
-        name: tokenData.name,
-        symbol: tokenData.symbol.toUpperCase(),
-        currentPrice,
-        ath,
-        athDate,
-        isAtATH,
-        isRecentATH,
-        priceChange1h: tokenData.market_data.price_change_percentage_1h || 0,
-        priceChange24h: tokenData.market_data.price_change_percentage_24h || 0
-      };
-    } catch (error) {
-      console.error(`Error checking ATH for token ${tokenId}:`, error.message);
+  // Markets rows already carry price and ATH data, so no per-coin request is needed.
+  // Returns the alert record if the token qualifies for this kind of check, else null.
+  // recentATHCutoff is the epoch ms an ATH must be newer than to count as recent,
+  // recentATHCutoffIso the same instant as an ISO string.
+  checkTokenATH(
+    token,
+    isInitialCheck,
+    recentATHCutoff = Date.now() - 60 * 60 * 1000,
+    recentATHCutoffIso = new Date(recentATHCutoff).toISOString()
+  ) {
+    const currentPrice = token.current_price;
+    const ath = token.ath;
+    if (currentPrice == null || ath == null || !token.ath_date) {
+      return null;
+    }
+
+    // Filter before building the record - most coins are nowhere near their ATH.
+    // Regular checks only compare prices, so ath_date is parsed just for rows that qualify.
+    if (!isInitialCheck && currentPrice < (ath * 0.999)) {
+      // For regular checks, look for tokens at or very close to ATH (within 0.1%)
+      return null;
+    }
+
+    // For initial check, look for tokens that hit ATH in the past hour. CoinGecko's ISO
+    // timestamps sort lexicographically, so a string compare rejects old ATHs without
+    // parsing; Date.parse still decides rows near the cutoff.
+    if (isInitialCheck && token.ath_date < recentATHCutoffIso) {
+      return null;
+    }
+
+    const athTime = Date.parse(token.ath_date);
+    if (isInitialCheck && !(athTime > recentATHCutoff)) {
       return null;
     }
+
+    return {
+      id: token.id,
+      name: escapeHtml(token.name),
+      symbol: escapeHtml(token.symbol.toUpperCase()),
+      currentPrice,
+      ath,
+      athTime,
+      priceChange1h: token.price_change_percentage_1h_in_currency || 0,
+      priceChange24h: token.price_change_percentage_24h || 0
+    };
   }
 
   async findATHTokens(isInitialCheck = false) {
@@ -155,40 +439,33 @@ class CoinGeckoATHMonitor {
       const tokens = await this.getTop3000Tokens();
       const athTokens = [];
       const now = Date.now();
+      const recentATHCutoff = now - 60 * 60 * 1000;
+      const recentATHCutoffIso = new Date(recentATHCutoff).toISOString();
 
-      for (let i = 0; i < tokens.length; i++) {
-        const token = tokens[i];
-        
+      for (const token of tokens) {
         // Skip if we've checked this token in the last 24 hours
         const lastChecked = lastCheckedTokens.get(token.id);
-        if (lastChecked && (now - lastChecked) < 24 * 60 * 60 * 1000) {
+        if (lastChecked && (now - lastChecked) < ALERT_COOLDOWN_MS) {
           continue;
         }
 
-        console.log(`Checking ${token.name} (${i + 1}/${tokens.length})...`);
-        
-        const athInfo = await this.checkTokenATH(token.id);
+        const athInfo = this.checkTokenATH(token, isInitialCheck, recentATHCutoff, recentATHCutoffIso);
         
         if (athInfo) {
-          if (isInitialCheck) {
-            // For initial check, look for tokens that hit ATH in the past hour
-            if (athInfo.isRecentATH) {
-              athTokens.push(athInfo);
-              lastCheckedTokens.set(token.id, now);
-            }
-          } else {
-            // For regular checks, look for current ATH tokens
-            if (athInfo.isAtATH) {
-              athTokens.push(athInfo);
-              lastCheckedTokens.set(token.id, now);
-            }
-          }
+          athTokens.push(athInfo);
+          markTokenAlerted(token.id, now);
         }
-
-        // Rate limiting - wait 1.2 seconds between detailed requests
-        await new Promise(resolve => setTimeout(resolve, 1200));
       }
 
+      // One summary line per scan instead of a log write per token
+      console.log(`Checked ${tokens.length} tokens, found ${athTokens.length} at ATH` +
+        (athTokens.length > 0 ? `: ${athTokens.map(token => token.id).join(' | ')}` : ''));
+
+      // Only rewrite the state file when this scan actually changed it
+      const pruned = pruneLastCheckedTokens(now);
+      if (athTokens.length > 0 || pruned > 0) {
+        await saveLastCheckedTokens();
+      }
       return athTokens;
     } catch (error) {
       console.error('Error finding ATH tokens:', error.message);
@@ -196,68 +473,101 @@ class CoinGeckoATHMonitor {
     }
   }
 
-  formatATHMessage(athTokens) {
+  formatATHMessage(athTokens, now = Date.now()) {
     if (athTokens.length === 0) {
       return '🔍 No tokens made all-time high during the monitored period.';
     }
 
-    let message = `🚀 *ALL-TIME HIGH ALERT* 🚀\n\n`;
-    message += `Found ${athTokens.length} token(s) at all-time high:\n\n`;
+    // Collect the pieces and join once instead of growing a string per line
+    const parts = [
+      `🚀 <b>ALL-TIME HIGH ALERT</b> 🚀\n\n`,
+      `Found ${athTokens.length} token(s) at all-time high:\n\n`
+    ];
 
     athTokens.forEach((token, index) => {
-      message += `${index + 1}. *${token.name}* (${token.symbol})\n`;
-      message += `   💰 Price: $${token.currentPrice.toLocaleString()}\n`;
-      message += `   📈 ATH: $${token.ath.toLocaleString()}\n`;
-      message += `   📅 ATH Date: ${moment(token.athDate).tz(this.timezone).format('YYYY-MM-DD HH:mm:ss')} GMT+8\n`;
-      message += `   📊 1h: ${token.priceChange1h.toFixed(2)}% | 24h: ${token.priceChange24h.toFixed(2)}%\n\n`;
+      parts.push(
+        `${index + 1}. <b>${token.name}</b> (${token.symbol})\n` +
+        `   💰 Price: $${formatPrice(token.currentPrice)}\n` +
+        `   📈 ATH: $${formatPrice(token.ath)}\n` +
+        `   📅 ATH Date: ${formatGMT8(token.athTime)} GMT+8\n` +
+        `   📊 1h: ${token.priceChange1h.toFixed(2)}% | 24h: ${token.priceChange24h.toFixed(2)}%\n\n`
+      );
     });
 
-    message += `_Last updated: ${moment().tz(this.timezone).format('YYYY-MM-DD HH:mm:ss')} GMT+8_`;
+    parts.push(`<i>Last updated: ${formatGMT8(now)} GMT+8</i>`);
     
-    return message;
+    return parts.join('');
   }
 
-  async sendTelegramMessage(message) {
-    try {
-      await bot.sendMessage(TELEGRAM_CHAT_ID, message, {
-        parse_mode: 'Markdown'
-      });
-      console.log('Telegram message sent successfully');
-    } catch (error) {
-      console.error('Error sending Telegram message:', error.message);
+  // Plain-text messages skip parse_mode so Telegram doesn't run the HTML parser on them
+  async sendTelegramMessage(message, { plainText = false } = {}) {
+    const payload = {
+      chat_id: TELEGRAM_CHAT_ID,
+      text: message,
+      disable_web_page_preview: true
+    };
+    if (!plainText) {
+      payload.parse_mode = 'HTML';
+    }
+
+    for (let attempt = 1; ; attempt++) {
+      try {
+        await this.telegramClient.post('/sendMessage', payload);
+        console.log('Telegram message sent successfully');
+        return;
+      } catch (error) {
+        const status = error.response && error.response.status;
+        const body = error.response && error.response.data;
+        if ((status === 429 || status >= 500) && attempt < MAX_REQUEST_ATTEMPTS) {
+          // Telegram reports the flood-wait in the body rather than a Retry-After header
+          const retryAfter = body && body.parameters && body.parameters.retry_after;
+          const delay = retryAfter ? retryAfter * 1000 : backoffDelay(attempt);
+          console.log(`Telegram send failed with ${status}, retrying in ${(delay / 1000).toFixed(1)}s`);
+          await sleep(delay);
+          continue;
+        }
+        console.error('Error sending Telegram message:', (body && body.description) || error.message);
+        return;
+      }
     }
   }
 }
 
 // Initialize monitor
 const monitor = new CoinGeckoATHMonitor();
+loadLastCheckedTokens();
+
+// Checks run one at a time: a full scan can still be running when the next
+// one is due, and overlapping scans double the API load and race on
+// lastCheckedTokens. Each run is chained after the previous one.
+let checkQueue = Promise.resolve();
+
+function runCheck(label, isInitialCheck) {
+  checkQueue = checkQueue.then(async () => {
+    try {
+      const athTokens = await monitor.findATHTokens(isInitialCheck);
+      const message = monitor.formatATHMessage(athTokens);
+      await monitor.sendTelegramMessage(message);
+    } catch (error) {
+      console.error(`${label} check failed:`, error.message);
+      await monitor.sendTelegramMessage(`❌ ${label} ATH check failed. Please check the logs.`, { plainText: true });
+    }
+  });
+  return checkQueue;
+}
 
 // Initial check on startup
 async function initialCheck() {
   console.log('Performing initial check for tokens with ATH in the past hour...');
-  try {
-    const athTokens = await monitor.findATHTokens(true);
-    const message = monitor.formatATHMessage(athTokens);
-    await monitor.sendTelegramMessage(message);
-  } catch (error) {
-    console.error('Initial check failed:', error.message);
-    await monitor.sendTelegramMessage('❌ Initial ATH check failed. Please check the logs.');
-  }
+  await runCheck('Initial', true);
 }
 
 // Daily check at 00:00 GMT+8
 cron.schedule('0 0 * * *', async () => {
   console.log('Running daily ATH check at 00:00 GMT+8...');
-  try {
-    const athTokens = await monitor.findATHTokens(false);
-    const message = monitor.formatATHMessage(athTokens);
-    await monitor.sendTelegramMessage(message);
-  } catch (error) {
-    console.error('Daily check failed:', error.message);
-    await monitor.sendTelegramMessage('❌ Daily ATH check failed. Please check the logs.');
-  }
+  await runCheck('Daily', false);
 }, {
-  timezone: "Asia/Singapore"
+  timezone: TIMEZONE
 });
 
 // Health check endpoint for Railway
@@ -282,19 +592,16 @@ app.listen(PORT, () => {
   console.log(`Server running on port ${PORT}`);
   console.log('CoinGecko ATH Monitor started');
   
-  // Run initial check after 30 seconds to allow server to fully start
-  setTimeout(() => {
-    initialCheck();
-  }, 30000);
+  // The server is already listening here, so the initial check can start right away
+  initialCheck();
 });
 
-// Graceful shutdown
-process.on('SIGTERM', () => {
-  console.log('Received SIGTERM, shutting down gracefully');
+// Graceful shutdown - close pooled keep-alive sockets before exiting
+function shutdown(signal) {
+  console.log(`Received ${signal}, shutting down gracefully`);
+  httpsAgent.destroy();
   process.exit(0);
-});
+}
 
-process.on('SIGINT', () => {
-  console.log('Received SIGINT, shutting down gracefully');
-  process.exit(0);
-});
+process.on('SIGTERM', () => shutdown('SIGTERM'));
+process.on('SIGINT', () => shutdown('SIGINT'));